@@ -9,10 +9,12 @@
 
 
 import json
+import re
 from threading import Lock
 
 from mo_parsing import debug
 
+from mo_sql_parsing.keywords import RESERVED
 from mo_sql_parsing.sql_parser import scrub
 from mo_sql_parsing.utils import ansi_string, simple_op, normal_op
 
@@ -70,7 +72,29 @@ def parse_sqlserver(sql, null=SQL_NULL, calls=simple_op):
         return _parse(sqlserver_parser, sql, null, calls)
 
 
-parse_bigquery = parse_mysql
+# SELECT * FROM name, WHERE name IS DOTTED PLAIN IDENTIFIERS (NO QUOTES, NO DASHES)
+# ONLY ASCII, AND ONLY THE WHITESPACE THE GRAMMAR SKIPS, SO NOTHING THE PARSER REJECTS GETS THROUGH
+simple_select = re.compile(
+    r"[ \t\r\n]*select[ \t\r\n]+\*[ \t\r\n]+from[ \t\r\n]+([a-z_][a-z0-9_]*(?:\.[a-z_][a-z0-9_]*)*)[ \t\r\n]*$",
+    re.IGNORECASE | re.ASCII,
+)
+reserved_words = set(RESERVED.expecting().keys())
+
+
+def parse_bigquery(sql, null=SQL_NULL, calls=simple_op):
+    """
+    PARSE BigQuery, WHICH IS THE SAME AS MySQL, BUT SKIP THE PARSER FOR THE SIMPLEST QUERY
+    :param sql: String of SQL
+    :param null: What value to use as NULL (default is the null function `{"null":{}}`)
+    :param calls: What to do with function calls (default is the simple_op function `{"op":{}}`)
+    :return: parse tree
+    """
+    found = simple_select.match(sql.rstrip().rstrip(";"))
+    if found:
+        name = found.group(1)
+        if not any(n.lower() in reserved_words for n in name.split(".")):
+            return {"select": "*", "from": name}
+    return parse_mysql(sql, null, calls)
 
 
 def _parse(parser, sql, null, calls):
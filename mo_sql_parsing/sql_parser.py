@@ -7,6 +7,7 @@
 # Contact: Kyle Lahnakoski (kyle@lahnakoski.com)
 #
 from mo_parsing import whitespaces, debug, Null
+from mo_parsing.utils import regex_range
 from mo_parsing.whitespaces import NO_WHITESPACE, Whitespace
 
 from mo_sql_parsing import utils
@@ -28,9 +29,12 @@ def no_dashes(tokens, start, string):
 
 
 digit = Char("0123456789")
-with whitespaces.NO_WHITESPACE:
-    ident_w_dash = Char(FIRST_IDENT_CHAR) + (Regex("(?<=[^ 0-9])\\-(?=[^ 0-9])") | Char(IDENT_CHAR))[...]
-    ident_w_dash = Regex(ident_w_dash.__regex__()[1]).set_parser_name("identifier_with_dashes") / no_dashes
+# FIRST_IDENT_CHAR, THEN IDENT_CHARs, WITH DASHES ALLOWED WHEN NOT NEXT TO A SPACE OR DIGIT
+# UNROLLED SO re SCANS RUNS OF IDENT_CHAR AT ONCE, NOT ONE ALTERNATION PER CHARACTER
+_ident_body = regex_range(IDENT_CHAR)
+ident_w_dash = Regex(
+    f"{regex_range(FIRST_IDENT_CHAR)}{_ident_body}*(?:(?<=[^ 0-9])\\-(?=[^ 0-9]){_ident_body}*)*"
+).set_parser_name("identifier_with_dashes") / no_dashes
 
 simple_ident = Word(FIRST_IDENT_CHAR, IDENT_CHAR).set_parser_name("identifier")
 
@@ -92,13 +96,17 @@ def parser(literal_string, simple_ident, sqlserver=False):
             + END
         ) / to_switch_call
 
-        casting = MatchFirst([
-            (
-                Group(Keyword(c, caseless=True)("op") + LB + expression("params") + AS + column_type("params") + RB)
-                / to_json_call
+        casting = (
+            Group(
+                MatchFirst([Keyword(c, caseless=True) for c in ["cast", "safe_cast", "try_cast"]])("op")
+                + LB
+                + expression("params")
+                + AS
+                + column_type("params")
+                + RB
             )
-            for c in ["cast", "safe_cast", "try_cast"]
-        ])
+            / to_json_call
+        )
 
         substring = (
             Group(
@@ -77,26 +77,54 @@ scrub_op = simple_op
 
 
 def scrub(result):
-    if result is SQL_NULL:
-        return SQL_NULL
-    elif result == None:
-        return None
-    elif isinstance(result, text):
-        return result
-    elif isinstance(result, binary_type):
-        return result.decode("utf8")
-    elif isinstance(result, number_types):
-        return result
-    elif isinstance(result, Call):
-        kwargs = scrub(result.kwargs)
-        args = scrub(result.args)
+    """
+    SIMPLIFY THE PARSE RESULTS TO JSON-IZABLE VALUES
+    USES AN EXPLICIT STACK, NOT RECURSION, SO DEEPLY NESTED SQL DOES NOT HIT THE RECURSION LIMIT
+    """
+    stack = []  # _scrub_children() GENERATORS, WAITING FOR THE SCRUBBED VALUE OF A CHILD
+    todo = result
+    while True:
+        if todo is SQL_NULL:
+            value = SQL_NULL
+        elif todo == None:
+            value = None
+        elif isinstance(todo, text):
+            value = todo
+        elif isinstance(todo, binary_type):
+            value = todo.decode("utf8")
+        elif isinstance(todo, number_types):
+            value = todo
+        elif isinstance(todo, dict) and not todo:
+            value = todo
+        else:
+            stack.append(_scrub_children(todo))
+            value = None
+
+        while stack:
+            try:
+                todo = stack[-1].send(value)
+                break
+            except StopIteration as done:
+                stack.pop()
+                value = done.value
+        else:
+            return value
+
+
+def _scrub_children(result):
+    """
+    YIELD EACH CHILD OF result, RECEIVE ITS SCRUBBED VALUE, AND RETURN THE SCRUBBED result
+    """
+    if isinstance(result, Call):
+        kwargs = yield result.kwargs
+        args = yield result.args
         if args is SQL_NULL:
             null_locations.append((kwargs, result.op))
         return scrub_op(result.op, args, kwargs)
-    elif isinstance(result, dict) and not result:
-        return result
     elif isinstance(result, list):
-        output = [rr for r in result for rr in [scrub(r)]]
+        output = []
+        for r in result:
+            output.append((yield r))
 
         if not output:
             return None
@@ -113,13 +141,17 @@ def scrub(result):
             kv_pairs = list(result.items())
         except Exception as c:
             print(c)
-        output = {k: vv for k, v in kv_pairs for vv in [scrub(v)] if not is_null(vv)}
+        output = {}
+        for k, v in kv_pairs:
+            vv = yield v
+            if not is_null(vv):
+                output[k] = vv
         if isinstance(result, dict) or output:
             for k, v in output.items():
                 if v is SQL_NULL:
                     null_locations.append((output, k))
             return output
-        return scrub(list(result))
+        return (yield list(result))
 
 
 def _chunk(values, size):
@@ -777,14 +809,17 @@ int_pos = Regex(r"\d+([eE]\+?\d+)?").set_parser_name("int") / parse_int
 hex_num = Regex(r"0x[0-9a-fA-F]+").set_parser_name("hex") / (lambda t: {"hex": t[0][2:]})
 
 # STRINGS
-ansi_string = Regex(r"\'(\'\'|[^'])*\'") / single_literal
-regex_string = (Regex(r'r\"(\\\"|[^"])*\"') | Regex(r"r\'(\\\'|[^'])*\'")) / literal_regex
-mysql_doublequote_string = Regex(r'\"(\"\"|[^"])*\"') / double_literal
+# UNROLLED LIKE THE IDENTIFIERS BELOW; A BACKSLASH IN AN r-STRING MAY ESCAPE THE QUOTE
+ansi_string = Regex(r"\'[^']*(?:\'\'[^']*)*\'") / single_literal
+regex_string = Regex(r"""r(?:\"[^"\\]*(?:\\\"?[^"\\]*)*\"|\'[^'\\]*(?:\\\'?[^'\\]*)*\')""") / literal_regex
+mysql_doublequote_string = Regex(r'\"[^"]*(?:\"\"[^"]*)*\"') / double_literal
 
 # BASIC IDENTIFIERS
-ansi_ident = Regex(r'\"(\"\"|[^"])*\"') / double_column
-mysql_backtick_ident = Regex(r"`(``|[^`])*`") / backtick_column
-sqlserver_ident = Regex(r"\[(\]\]|[^\]])*\]") / square_column
+# UNROLLED `[^`]*(``[^`]*)*` RATHER THAN `(``|[^`])*`, SO re SCANS RUNS OF
+# PLAIN CHARACTERS AT ONCE, NOT ONE ALTERNATION PER CHARACTER
+ansi_ident = Regex(r'\"[^"]*(?:\"\"[^"]*)*\"') / double_column
+mysql_backtick_ident = Regex(r"`[^`]*(?:``[^`]*)*`") / backtick_column
+sqlserver_ident = Regex(r"\[[^\]]*(?:\]\][^\]]*)*\]") / square_column
 
 copy_params = (
     "ALLOW_DUPLICATE",
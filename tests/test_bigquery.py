@@ -12,7 +12,205 @@ from unittest import TestCase, skip
 from mo_parsing.debug import Debugger
 from mo_testing.fuzzytestcase import FuzzyTestCase
 
-from mo_sql_parsing import parse_bigquery as parse
+from mo_sql_parsing import parse_bigquery as parse, parse_mysql
+
+
+# EXPECTED TREE FOR test_issue_162_extract_from, BUILT ONCE AT IMPORT
+_fmt_A = {"format_date": [{"literal": "%A"}, {"date": "full_date"}]}
+_fmt_B = {"format_datetime": [{"literal": "%B"}, {"datetime": "full_date"}]}
+
+_ISSUE_162_EXPECTED = {
+    "select": [
+        {
+            "value": {"format_datetime": [{"literal": "%Y%m%d"}, {"datetime": "full_date"}]},
+            "name": "date_key",
+        },
+        {"value": "full_date"},
+        {
+            "value": {"format_datetime": [{"literal": "%Y/%m/%d"}, {"datetime": "full_date"}]},
+            "name": "date_name",
+        },
+        {"value": {"extract": ["dow", "full_date"]}, "name": "day_of_week"},
+        {
+            "value": {"case": [
+                {
+                    "then": {"literal": "Domingo"},
+                    "when": {"eq": [_fmt_A, {"literal": "Sunday"}]},
+                },
+                {
+                    "then": {"literal": "Segunda-feira"},
+                    "when": {"eq": [_fmt_A, {"literal": "Monday"}]},
+                },
+                {
+                    "then": {"literal": "Terça-feira"},
+                    "when": {"eq": [_fmt_A, {"literal": "Tuesday"}]},
+                },
+                {
+                    "then": {"literal": "Quarta-feira"},
+                    "when": {"eq": [_fmt_A, {"literal": "Wednesday"}]},
+                },
+                {
+                    "then": {"literal": "Quinta-feira"},
+                    "when": {"eq": [_fmt_A, {"literal": "Thursday"}]},
+                },
+                {
+                    "then": {"literal": "Sexta-feira"},
+                    "when": {"eq": [_fmt_A, {"literal": "Friday"}]},
+                },
+                {
+                    "then": {"literal": "Sábado"},
+                    "when": {"eq": [_fmt_A, {"literal": "Saturday"}]},
+                },
+            ]},
+            "name": "day_name_of_week",
+        },
+        {
+            "value": {"format_datetime": [{"literal": "%d"}, {"datetime": "full_date"}]},
+            "name": "day_of_month",
+        },
+        {"value": {"extract": ["doy", "full_date"]}, "name": "day_of_year"},
+        {
+            "value": {"case": [
+                {
+                    "then": {"literal": "Final de Semana"},
+                    "when": {"eq": [_fmt_A, {"literal": "Saturday"}]},
+                },
+                {
+                    "then": {"literal": "Final de Semana"},
+                    "when": {"eq": [_fmt_A, {"literal": "Sunday"}]},
+                },
+                {"literal": "Dia da Semana"},
+            ]},
+            "name": "weekday_weekend",
+        },
+        {"value": {"add": [{"extract": ["week", "full_date"]}, 1]}, "name": "week_of_year"},
+        {
+            "value": {"case": [
+                {
+                    "then": {"literal": "Janeiro"},
+                    "when": {"eq": [_fmt_B, {"literal": "January"}]},
+                },
+                {
+                    "then": {"literal": "Fevereiro"},
+                    "when": {"eq": [_fmt_B, {"literal": "February"}]},
+                },
+                {
+                    "then": {"literal": "Março"},
+                    "when": {"eq": [_fmt_B, {"literal": "March"}]},
+                },
+                {
+                    "then": {"literal": "Abril"},
+                    "when": {"eq": [_fmt_B, {"literal": "April"}]},
+                },
+                {
+                    "then": {"literal": "Maio"},
+                    "when": {"eq": [_fmt_B, {"literal": "May"}]},
+                },
+                {
+                    "then": {"literal": "Junho"},
+                    "when": {"eq": [_fmt_B, {"literal": "June"}]},
+                },
+                {
+                    "then": {"literal": "Julho"},
+                    "when": {"eq": [_fmt_B, {"literal": "July"}]},
+                },
+                {
+                    "then": {"literal": "Agosto"},
+                    "when": {"eq": [_fmt_B, {"literal": "August"}]},
+                },
+                {
+                    "then": {"literal": "Setembro"},
+                    "when": {"eq": [_fmt_B, {"literal": "September"}]},
+                },
+                {
+                    "then": {"literal": "Outubro"},
+                    "when": {"eq": [_fmt_B, {"literal": "October"}]},
+                },
+                {
+                    "then": {"literal": "Novembro"},
+                    "when": {"eq": [_fmt_B, {"literal": "November"}]},
+                },
+                {
+                    "then": {"literal": "Dezembro"},
+                    "when": {"eq": [_fmt_B, {"literal": "December"}]},
+                },
+            ]},
+            "name": "month_name",
+        },
+        {"value": {"extract": ["month", "full_date"]}, "name": "month_of_year"},
+        {
+            "value": {"if": [
+                {"eq": [
+                    {"date_sub": [
+                        {"date_trunc": [{"date_add": ["full_date", {"interval": [1, "month"]}]}, "MONTH"]},
+                        {"interval": [1, "day"]},
+                    ]},
+                    "full_date",
+                ]},
+                {"literal": "Y"},
+                {"literal": "N"},
+            ]},
+            "name": "is_last_day_of_month",
+        },
+        {"value": {"extract": ["quarter", "full_date"]}, "name": "calendar_quarter"},
+        {"value": {"extract": ["year", "full_date"]}, "name": "calendar_year"},
+        {
+            "value": {"format_datetime": [{"literal": "%Y-%m"}, {"datetime": "full_date"}]},
+            "name": "calendar_year_month",
+        },
+        {
+            "value": {"concat": [
+                {"extract": ["year", "full_date"]},
+                {"literal": "Q"},
+                {"extract": ["quarter", "full_date"]},
+            ]},
+            "name": "calendar_year_qtr",
+        },
+        {"value": 20170921, "name": "insert_audit_key"},
+        {"value": 20170921, "name": "update_audit_key"},
+        {"value": {"if": [{"eq": ["full_date", "holiday.date"]}, 1, 0]}, "name": "is_national_holiday"},
+        {"value": 1, "name": "filter"},
+        {
+            "value": {"date_sub": [
+                {"date_trunc": [{"date_add": ["full_date", {"interval": [1, "month"]}]}, "month"]},
+                {"interval": [1, "day"]},
+            ]},
+            "name": "last_day_of_month",
+        },
+        {
+            "value": {"format_datetime": [
+                {"literal": "%Y%m%d"},
+                {"datetime": {"date_sub": [
+                    {"date_trunc": [{"date_add": ["full_date", {"interval": [1, "month"]}]}, "month"]},
+                    {"interval": [1, "day"]},
+                ]}},
+            ]},
+            "name": "last_day_of_month_key",
+        },
+        {"value": {"date_trunc": ["full_date", "month"]}, "name": "first_day_of_month"},
+        {
+            "value": {"format_datetime": [
+                {"literal": "%Y%m%d"},
+                {"datetime": {"date_trunc": ["full_date", "month"]}},
+            ]},
+            "name": "first_day_of_month_key",
+        },
+    ],
+    "from": [
+        {
+            "value": {"unnest": {"generate_date_array": [
+                {"literal": "2000-01-01"},
+                {"date_add": [{"last_day": ["current_date", "YEAR"]}, {"interval": [5, "year"]}]},
+                {"interval": [1, "day"]},
+            ]}},
+            "name": "full_date",
+        },
+        {
+            "left join": {"value": "financial_holiday", "name": "holiday"},
+            "on": {"eq": ["holiday.date", "full_date"]},
+        },
+    ],
+}
 
 
 class TestBigQuery(TestCase):
@@ -389,6 +587,21 @@ class TestBigQuery(TestCase):
         with FuzzyTestCase.assertRaises("""'a'.b.`c`" (at char 27), (line:2, col:27)"""):
             parse(sql)
 
+    def test_simple_select_same_as_parser(self):
+        for sql in ["SELECT * FROM a", "select *\n from a.b_c ;", "SELECT * FROM select", "SELECT * FROM current_date"]:
+            self.assertEqual(parse(sql), parse_mysql(sql))
+
+        for sql in [
+            "SELECT * FROM \u212a",
+            "SELECT\xa0*\xa0FROM a",
+            "SELECT\u2003* FROM a",
+            "SELECT *\x1cFROM a",
+            "SELECT\x0b* FROM a",
+            "SELECT * FROM\x0ca",
+        ]:
+            self.assertRaises(Exception, parse_mysql, sql)
+            self.assertRaises(Exception, parse, sql)
+
     def test_issue_96_r_expressions1(self):
         result = parse("SELECT regex_extract(x, r'[a-z]'), value FROM `a.b.c`")
         expected = {
@@ -658,262 +871,7 @@ class TestBigQuery(TestCase):
         JOIN financial_holiday holiday     
           ON holiday.date = full_date"""
         )
-        expected = {
-            "select": [
-                {
-                    "value": {"format_datetime": [{"literal": "%Y%m%d"}, {"datetime": "full_date"}]},
-                    "name": "date_key",
-                },
-                {"value": "full_date"},
-                {
-                    "value": {"format_datetime": [{"literal": "%Y/%m/%d"}, {"datetime": "full_date"}]},
-                    "name": "date_name",
-                },
-                {"value": {"extract": ["dow", "full_date"]}, "name": "day_of_week"},
-                {
-                    "value": {"case": [
-                        {
-                            "then": {"literal": "Domingo"},
-                            "when": {"eq": [
-                                {"format_date": [{"literal": "%A"}, {"date": "full_date"}]},
-                                {"literal": "Sunday"},
-                            ]},
-                        },
-                        {
-                            "then": {"literal": "Segunda-feira"},
-                            "when": {"eq": [
-                                {"format_date": [{"literal": "%A"}, {"date": "full_date"}]},
-                                {"literal": "Monday"},
-                            ]},
-                        },
-                        {
-                            "then": {"literal": "Terça-feira"},
-                            "when": {"eq": [
-                                {"format_date": [{"literal": "%A"}, {"date": "full_date"}]},
-                                {"literal": "Tuesday"},
-                            ]},
-                        },
-                        {
-                            "then": {"literal": "Quarta-feira"},
-                            "when": {"eq": [
-                                {"format_date": [{"literal": "%A"}, {"date": "full_date"}]},
-                                {"literal": "Wednesday"},
-                            ]},
-                        },
-                        {
-                            "then": {"literal": "Quinta-feira"},
-                            "when": {"eq": [
-                                {"format_date": [{"literal": "%A"}, {"date": "full_date"}]},
-                                {"literal": "Thursday"},
-                            ]},
-                        },
-                        {
-                            "then": {"literal": "Sexta-feira"},
-                            "when": {"eq": [
-                                {"format_date": [{"literal": "%A"}, {"date": "full_date"}]},
-                                {"literal": "Friday"},
-                            ]},
-                        },
-                        {
-                            "then": {"literal": "Sábado"},
-                            "when": {"eq": [
-                                {"format_date": [{"literal": "%A"}, {"date": "full_date"}]},
-                                {"literal": "Saturday"},
-                            ]},
-                        },
-                    ]},
-                    "name": "day_name_of_week",
-                },
-                {
-                    "value": {"format_datetime": [{"literal": "%d"}, {"datetime": "full_date"}]},
-                    "name": "day_of_month",
-                },
-                {"value": {"extract": ["doy", "full_date"]}, "name": "day_of_year"},
-                {
-                    "value": {"case": [
-                        {
-                            "then": {"literal": "Final de Semana"},
-                            "when": {"eq": [
-                                {"format_date": [{"literal": "%A"}, {"date": "full_date"}]},
-                                {"literal": "Saturday"},
-                            ]},
-                        },
-                        {
-                            "then": {"literal": "Final de Semana"},
-                            "when": {"eq": [
-                                {"format_date": [{"literal": "%A"}, {"date": "full_date"}]},
-                                {"literal": "Sunday"},
-                            ]},
-                        },
-                        {"literal": "Dia da Semana"},
-                    ]},
-                    "name": "weekday_weekend",
-                },
-                {"value": {"add": [{"extract": ["week", "full_date"]}, 1]}, "name": "week_of_year"},
-                {
-                    "value": {"case": [
-                        {
-                            "then": {"literal": "Janeiro"},
-                            "when": {"eq": [
-                                {"format_datetime": [{"literal": "%B"}, {"datetime": "full_date"}]},
-                                {"literal": "January"},
-                            ]},
-                        },
-                        {
-                            "then": {"literal": "Fevereiro"},
-                            "when": {"eq": [
-                                {"format_datetime": [{"literal": "%B"}, {"datetime": "full_date"}]},
-                                {"literal": "February"},
-                            ]},
-                        },
-                        {
-                            "then": {"literal": "Março"},
-                            "when": {"eq": [
-                                {"format_datetime": [{"literal": "%B"}, {"datetime": "full_date"}]},
-                                {"literal": "March"},
-                            ]},
-                        },
-                        {
-                            "then": {"literal": "Abril"},
-                            "when": {"eq": [
-                                {"format_datetime": [{"literal": "%B"}, {"datetime": "full_date"}]},
-                                {"literal": "April"},
-                            ]},
-                        },
-                        {
-                            "then": {"literal": "Maio"},
-                            "when": {"eq": [
-                                {"format_datetime": [{"literal": "%B"}, {"datetime": "full_date"}]},
-                                {"literal": "May"},
-                            ]},
-                        },
-                        {
-                            "then": {"literal": "Junho"},
-                            "when": {"eq": [
-                                {"format_datetime": [{"literal": "%B"}, {"datetime": "full_date"}]},
-                                {"literal": "June"},
-                            ]},
-                        },
-                        {
-                            "then": {"literal": "Julho"},
-                            "when": {"eq": [
-                                {"format_datetime": [{"literal": "%B"}, {"datetime": "full_date"}]},
-                                {"literal": "July"},
-                            ]},
-                        },
-                        {
-                            "then": {"literal": "Agosto"},
-                            "when": {"eq": [
-                                {"format_datetime": [{"literal": "%B"}, {"datetime": "full_date"}]},
-                                {"literal": "August"},
-                            ]},
-                        },
-                        {
-                            "then": {"literal": "Setembro"},
-                            "when": {"eq": [
-                                {"format_datetime": [{"literal": "%B"}, {"datetime": "full_date"}]},
-                                {"literal": "September"},
-                            ]},
-                        },
-                        {
-                            "then": {"literal": "Outubro"},
-                            "when": {"eq": [
-                                {"format_datetime": [{"literal": "%B"}, {"datetime": "full_date"}]},
-                                {"literal": "October"},
-                            ]},
-                        },
-                        {
-                            "then": {"literal": "Novembro"},
-                            "when": {"eq": [
-                                {"format_datetime": [{"literal": "%B"}, {"datetime": "full_date"}]},
-                                {"literal": "November"},
-                            ]},
-                        },
-                        {
-                            "then": {"literal": "Dezembro"},
-                            "when": {"eq": [
-                                {"format_datetime": [{"literal": "%B"}, {"datetime": "full_date"}]},
-                                {"literal": "December"},
-                            ]},
-                        },
-                    ]},
-                    "name": "month_name",
-                },
-                {"value": {"extract": ["month", "full_date"]}, "name": "month_of_year"},
-                {
-                    "value": {"if": [
-                        {"eq": [
-                            {"date_sub": [
-                                {"date_trunc": [{"date_add": ["full_date", {"interval": [1, "month"]}]}, "MONTH"]},
-                                {"interval": [1, "day"]},
-                            ]},
-                            "full_date",
-                        ]},
-                        {"literal": "Y"},
-                        {"literal": "N"},
-                    ]},
-                    "name": "is_last_day_of_month",
-                },
-                {"value": {"extract": ["quarter", "full_date"]}, "name": "calendar_quarter"},
-                {"value": {"extract": ["year", "full_date"]}, "name": "calendar_year"},
-                {
-                    "value": {"format_datetime": [{"literal": "%Y-%m"}, {"datetime": "full_date"}]},
-                    "name": "calendar_year_month",
-                },
-                {
-                    "value": {"concat": [
-                        {"extract": ["year", "full_date"]},
-                        {"literal": "Q"},
-                        {"extract": ["quarter", "full_date"]},
-                    ]},
-                    "name": "calendar_year_qtr",
-                },
-                {"value": 20170921, "name": "insert_audit_key"},
-                {"value": 20170921, "name": "update_audit_key"},
-                {"value": {"if": [{"eq": ["full_date", "holiday.date"]}, 1, 0]}, "name": "is_national_holiday"},
-                {"value": 1, "name": "filter"},
-                {
-                    "value": {"date_sub": [
-                        {"date_trunc": [{"date_add": ["full_date", {"interval": [1, "month"]}]}, "month"]},
-                        {"interval": [1, "day"]},
-                    ]},
-                    "name": "last_day_of_month",
-                },
-                {
-                    "value": {"format_datetime": [
-                        {"literal": "%Y%m%d"},
-                        {"datetime": {"date_sub": [
-                            {"date_trunc": [{"date_add": ["full_date", {"interval": [1, "month"]}]}, "month"]},
-                            {"interval": [1, "day"]},
-                        ]}},
-                    ]},
-                    "name": "last_day_of_month_key",
-                },
-                {"value": {"date_trunc": ["full_date", "month"]}, "name": "first_day_of_month"},
-                {
-                    "value": {"format_datetime": [
-                        {"literal": "%Y%m%d"},
-                        {"datetime": {"date_trunc": ["full_date", "month"]}},
-                    ]},
-                    "name": "first_day_of_month_key",
-                },
-            ],
-            "from": [
-                {
-                    "value": {"unnest": {"generate_date_array": [
-                        {"literal": "2000-01-01"},
-                        {"date_add": [{"last_day": ["current_date", "YEAR"]}, {"interval": [5, "year"]}]},
-                        {"interval": [1, "day"]},
-                    ]}},
-                    "name": "full_date",
-                },
-                {
-                    "left join": {"value": "financial_holiday", "name": "holiday"},
-                    "on": {"eq": ["holiday.date", "full_date"]},
-                },
-            ],
-        }
-        self.assertEqual(result, expected)
+        self.assertEqual(result, _ISSUE_162_EXPECTED)
 
     def test_issue_163_at_time_zone(self):
         result = parse(
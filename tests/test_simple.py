@@ -829,6 +829,14 @@ class TestSimple(TestCase):
         expected = {"select": {"value": {"in": ["a", ["abc", 3, {"literal": "def"}]]}}}
         self.assertEqual(result, expected)
 
+    def test_deeply_nested_not(self):
+        sql = "SELECT " + "NOT " * 200 + "a"
+        result = parse(sql)
+        expected = "a"
+        for _ in range(200):
+            expected = {"not": expected}
+        self.assertEqual(result, {"select": {"value": expected}})
+
     def test_issue_107_recursion(self):
         sql = (
             " SELECT city_name"